@@ -10,7 +10,62 @@ data on NEOs and close approaches extracted by `extract.load_neos` and
 `extract.load_approaches`.
 """
 
-import math
+from array import array
+from bisect import bisect_left, bisect_right
+
+
+def _filter_indices(dates, dists, vels, diams, haz_rows,
+                    lo_d, hi_d, lo_v, hi_v, lo_dia, hi_dia,
+                    date_eq, start, end, haz_flag):
+    """Return the indices of the rows that match every filter.
+
+    The first four arguments are columns of an `NEODatabase`, whose rows are
+    sorted by date so that the date filters can be answered by bisecting
+    `dates` for a range of rows rather than by scanning it. `haz_rows` holds
+    the ascending indices of the rows whose NEO is not hazardous and of those
+    whose NEO is, so the hazardous filter picks its candidate rows directly.
+
+    The remaining arguments are the filter bounds; a filter that isn't set is
+    passed as a sentinel instead - `-inf`/`inf` for the numeric bounds and `-1`
+    for the date ordinals and the hazardous flag - so every call has the same
+    argument types. The list of predicates for the numeric filters is
+    specialized once per call to just the filters that are set; each one then
+    narrows the selection with one pass over its column, so later predicates
+    only look at rows still selected.
+
+    Unknown diameters are NaN, which compares false either way, so an approach
+    whose NEO has no diameter never matches a diameter filter.
+
+    :return: An iterable of the indices of the matching rows, in order.
+    """
+    inf = float('inf')
+    lo, hi = 0, len(dates)
+    if date_eq != -1:
+        lo = max(lo, bisect_left(dates, date_eq))
+        hi = min(hi, bisect_right(dates, date_eq))
+    if start != -1:
+        lo = max(lo, bisect_left(dates, start))
+    if end != -1:
+        hi = min(hi, bisect_right(dates, end))
+
+    # A range filter with only one bound set keeps the other at infinity, so
+    # every numeric filter is a single chained comparison per row.
+    predicates = []
+    if lo_d != -inf or hi_d != inf:
+        predicates.append((dists, lo_d, hi_d))
+    if lo_v != -inf or hi_v != inf:
+        predicates.append((vels, lo_v, hi_v))
+    if lo_dia != -inf or hi_dia != inf:
+        predicates.append((diams, lo_dia, hi_dia))
+
+    if haz_flag != -1:
+        rows = haz_rows[haz_flag]
+        selected = rows[bisect_left(rows, lo):bisect_left(rows, hi)]
+    else:
+        selected = range(lo, hi)
+    for column, low, high in predicates:
+        selected = [i for i in selected if low <= column[i] <= high]
+    return selected
 
 
 class NEODatabase:
@@ -42,8 +97,32 @@ class NEODatabase:
 
         for approach in self._approaches:
             neo = self.neo_with_designation[approach._designation]
+            approach.neo = neo
             neo.approaches.append(approach)
 
+        # Column-oriented copies of the attributes `query` filters on, so that
+        # each filter scans one contiguous array instead of chasing attributes
+        # through every `CloseApproach` and its `NearEarthObject`.
+        neo_index = {neo.designation: i for i, neo in enumerate(self._neos)}
+        self._diam = array('d', (neo.diameter for neo in self._neos))
+        self._haz = array('b', (neo.hazardous for neo in self._neos))
+
+        # The rows are kept sorted by approach date, so a date filter can find
+        # its rows by bisecting `_dates` instead of scanning every approach.
+        self._approach_objs = sorted(self._approaches, key=lambda approach: approach.date)
+        self._dist = array('d', (approach.distance for approach in self._approach_objs))
+        self._vel = array('d', (approach.velocity for approach in self._approach_objs))
+        self._dates = array('l', (approach.date.toordinal() for approach in self._approach_objs))
+        self._neo_idx = array('l', (neo_index[approach._designation] for approach in self._approach_objs))
+
+        # Pre-gather the NEO columns per approach so no join is needed at query time.
+        self._ca_diam = array('d', (self._diam[i] for i in self._neo_idx))
+        self._ca_haz = array('b', (self._haz[i] for i in self._neo_idx))
+
+        # The rows of non-hazardous and of hazardous approaches, in date order.
+        self._rows_by_haz = ([], [])
+        for i, flag in enumerate(self._ca_haz):
+            self._rows_by_haz[flag].append(i)
 
 
 # Get neo by primary designation
@@ -91,137 +170,33 @@ class NEODatabase:
 
         The `CloseApproach` objects are generated in internal order, which isn't
         guaranteed to be sorted meaningfully, although is often sorted by time.
+        Filtered results are generated in order of approach date.
 
-        :param filters: A collection of filters capturing user-specified criteria.
+        :param filters: A `Filters` collection capturing user-specified criteria.
         :return: A stream of matching `CloseApproach` objects.
         """
-        none_count = 0
-        min_dist = filters['distance_min']
-        max_dist = filters['distance_max']
-        min_velocity = filters['velocity_min']
-        max_velocity = filters['velocity_max']
-        min_dia = filters['diameter_min']
-        max_dia = filters['diameter_max']
-        for value in filters.values():
-            if value is None:
-                none_count += 1
-        if none_count != 10:
-            for each_approach in self._approaches:
-
-                apply_filters = False
-
-                if filters['date']:  #filter based on date
-                    app_date = each_approach.time.date()
-                    if filters['date'] == app_date:
-                        apply_filters = True
-                    else:
-                        apply_filters = False
-                        continue
-
-                app_date_range = each_approach.time.date()
-                if filters['start_date'] and filters['end_date']:  #filter based on date range
-                    if filters['start_date'] <= app_date_range <= filters['end_date']:
-                        apply_filters = True
-                    else:
-                        apply_filters = False
-                        continue
-
-                elif filters['start_date']:
-                    if filters['start_date'] <= app_date_range:
-                        apply_filters = True
-                    else:
-                        apply_filters = False
-                        continue
-
-                elif filters['end_date']:
-                    if app_date_range <= filters['end_date']:
-                        apply_filters = True
-                    else:
-                        apply_filters = False
-                        continue
-
-
-        #------------------------------------------------------------------------------------------------------------
-                if min_dist and max_dist:  #filter based on min and max distance
-                    if float(min_dist) <= each_approach.distance <= float(max_dist):
-                        apply_filters = True
-                    else:
-                        apply_filters = False
-                        continue
-
-                elif min_dist:    #filter based on min distance
-                    if each_approach.distance >= float(min_dist):
-                        apply_filters = True
-                    else:
-                        apply_filters = False
-                        continue
-
-                elif max_dist:     #filter based on max distance
-                    if each_approach.distance <= float(max_dist):
-                        apply_filters = True
-                    else:
-                        apply_filters = False
-                        continue
-#---------------------------------------------------------------------------------------------------------
-                if min_velocity and max_velocity:
-                    if float(min_velocity) <= each_approach.velocity <= float(max_velocity):
-                        apply_filters = True
-                    else:
-                        apply_filters = False
-                        continue
-
-                elif min_velocity:
-                    if each_approach.velocity >= float(min_velocity):
-                        apply_filters = True
-                    else:
-                        apply_filters = False
-                        continue
-
-                elif max_velocity:
-                    if each_approach.velocity <= float(max_velocity):
-                        apply_filters = True
-                    else:
-                        apply_filters = False
-                        continue
-#-------------------------------------------------------------------------------------------------------------------
-                if min_dia and max_dia:
-                    if math.isnan(each_approach.neo.diameter):
-                        continue
-                    if float(min_dia) <= each_approach.neo.diameter <= float(max_dia):
-                        apply_filters = True
-                    else:
-                        apply_filters = False
-                        continue
-
-                elif min_dia:
-                    if math.isnan(each_approach.neo.diameter):
-                        continue
-                    if each_approach.neo.diameter >= float(min_dia):
-                        apply_filters = True
-                    else:
-                        apply_filters = False
-                        continue
-
-                elif max_dia:
-                    if math.isnan(each_approach.neo.diameter):
-                        continue
-                    if each_approach.neo.diameter <= float(max_dia):
-                        apply_filters = True
-                    else:
-                        apply_filters = False
-                        continue
-    #--------------------------------------------------------------------------------------------------------------
-                if filters['hazardous'] is not None:
-                    if filters['hazardous'] == each_approach.neo.hazardous:
-                        apply_filters = True
-                    else:
-                        apply_filters = False
-                        continue
-
-                if apply_filters:
-                    yield each_approach
-
-
-        else:
-            for each_approach in self._approaches:
-                yield each_approach
+        if not filters or all(value is None for value in filters):
+            yield from self._approaches
+            return
+
+        # Convert the thresholds once, up front, rather than per row; an
+        # unset bound becomes an infinite one.
+        inf = float('inf')
+        dist_lo = float(filters.distance_min) if filters.distance_min else -inf
+        dist_hi = float(filters.distance_max) if filters.distance_max else inf
+        vel_lo = float(filters.velocity_min) if filters.velocity_min else -inf
+        vel_hi = float(filters.velocity_max) if filters.velocity_max else inf
+        dia_lo = float(filters.diameter_min) if filters.diameter_min else -inf
+        dia_hi = float(filters.diameter_max) if filters.diameter_max else inf
+        date = filters.date.toordinal() if filters.date else -1
+        start_date = filters.start_date.toordinal() if filters.start_date else -1
+        end_date = filters.end_date.toordinal() if filters.end_date else -1
+        hazardous = int(filters.hazardous) if filters.hazardous is not None else -1
+
+        selected = _filter_indices(
+            self._dates, self._dist, self._vel, self._ca_diam, self._rows_by_haz,
+            dist_lo, dist_hi, vel_lo, vel_hi, dia_lo, dia_hi,
+            date, start_date, end_date, hazardous)
+        objs = self._approach_objs
+        for i in selected:
+            yield objs[i]
@@ -11,12 +11,15 @@ The main module calls these functions with the arguments provided at the command
 line, and uses the resulting collections to build an `NEODatabase`.
 """
 import csv
-import json
-
-from models import NearEarthObject, CloseApproach
 
+# `orjson` parses the (large) close approach file considerably faster, but is
+# optional; the standard library's `json.loads` accepts the same bytes input.
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
-instances = {}
+from models import NearEarthObject, CloseApproach
 
 
 def load_neos(neo_csv_path):
@@ -26,12 +29,11 @@ def load_neos(neo_csv_path):
     :return: A collection of `NearEarthObject`s.
     """
     with open(neo_csv_path, 'r') as csv_file:  #read from csv
-        reader = csv.DictReader(csv_file)
-        neo_instances = []
-        for row in reader:
-            content = NearEarthObject(row['pdes'], row['name'], row['diameter'], row['pha'])  #read data from required cols
-            neo_instances.append(content)
-            instances[row['pdes']] = content
+        reader = csv.reader(csv_file)
+        header = next(reader)
+        i_pdes, i_name, i_dia, i_pha = (header.index(col) for col in ('pdes', 'name', 'diameter', 'pha'))
+        neo_instances = [NearEarthObject(row[i_pdes], row[i_name], row[i_dia], row[i_pha])  #read data from required cols
+                         for row in reader]
     return neo_instances
 
 
@@ -41,12 +43,9 @@ def load_approaches(cad_json_path):
     :param cad_json_path: A path to a JSON file containing data about close approaches.
     :return: A collection of `CloseApproach`es.
     """
-    close_app_instances = []
-    with open(cad_json_path, 'r') as json_file:  #load json data
-        data = json.load(json_file)
-        content = data['data']
-        for d in content:
-            each_row = CloseApproach(instances.get(d[0]), d[3], d[4], d[7])
-            close_app_instances.append(each_row)
+    with open(cad_json_path, 'rb') as json_file:  #load json data
+        data = json_loads(json_file.read())
+    content = data['data']
+    close_app_instances = [CloseApproach(d[0], d[3], d[4], d[7]) for d in content]
 
     return close_app_instances
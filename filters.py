@@ -3,7 +3,8 @@
 The `create_filters` function produces a collection of objects that is used by
 the `query` method to generate a stream of `CloseApproach` objects that match
 all of the desired criteria. The arguments to `create_filters` are provided by
-the main module and originate from the user's command-line options.
+the main module and originate from the user's command-line options, and are
+collected into a `Filters` named tuple.
 
 This function can be thought to return a collection of instances of subclasses
 of `AttributeFilter` - a 1-argument callable (on a `CloseApproach`) constructed
@@ -15,6 +16,15 @@ The `limit` function simply limits the maximum number of values produced by an
 iterator.
 """
 import itertools
+from collections import namedtuple
+
+
+# The user-supplied criteria for `NEODatabase.query`; an unset criterion is `None`.
+Filters = namedtuple('Filters', ['date', 'start_date', 'end_date',
+                                 'distance_min', 'distance_max',
+                                 'velocity_min', 'velocity_max',
+                                 'diameter_min', 'diameter_max',
+                                 'hazardous'])
 
 
 def create_filters(date=None, start_date=None, end_date=None,
@@ -34,14 +44,13 @@ def create_filters(date=None, start_date=None, end_date=None,
     :param diameter_min: A minimum diameter of the NEO of a matching `CloseApproach`.
     :param diameter_max: A maximum diameter of the NEO of a matching `CloseApproach`.
     :param hazardous: Whether the NEO of a matching `CloseApproach` is potentially hazardous.
-    :return: A collection of filters for use with `query`.
+    :return: A `Filters` collection for use with `query`.
     """
-    func_arguments = locals().items()
-    filters = {}
-    for each_key, each_val in func_arguments:
-        filters[each_key] = each_val
-
-    return filters
+    return Filters(date, start_date, end_date,
+                   distance_min, distance_max,
+                   velocity_min, velocity_max,
+                   diameter_min, diameter_max,
+                   hazardous)
 
 
 def limit(iterator, n=None):
@@ -31,13 +31,13 @@ class NearEarthObject:
     `NEODatabase` constructor.
     """
 
+    __slots__ = ('designation', 'name', 'diameter', 'diameter_nan', 'hazardous', 'approaches')
+
     def __init__(self, designation, name, diameter, hazardous, **info):
         """Create a new `NearEarthObject`.
 
         :param info: A dictionary of excess keyword arguments supplied to the constructor.
         """
-        for value in info.values():
-            name = value
         self.designation = designation
         if not name:
             self.name = None
@@ -47,6 +47,8 @@ class NearEarthObject:
             self.diameter = float('nan')
         else:
             self.diameter = float(diameter)
+        # NaN is the only float that isn't equal to itself.
+        self.diameter_nan = self.diameter != self.diameter
         if hazardous == 'Y':
             self.hazardous = True
         else:
@@ -95,15 +97,18 @@ class CloseApproach:
     `NEODatabase` constructor.
     """
 
-    def __init__(self, neo, time, distance, velocity, **info):
+    __slots__ = ('_designation', 'neo', 'time', 'date', 'distance', 'velocity')
+
+    def __init__(self, designation, time, distance, velocity, **info):
         """Create a new `CloseApproach`.
 
         :param info: A dictionary of excess keyword arguments supplied to the constructor.
         """
-        self.neo = neo
-        self._designation = neo.designation
+        self._designation = designation
+        self.neo = None
         #self.name = name
         self.time = cd_to_datetime(time)
+        self.date = self.time.date()
         self.distance = float(distance)
         self.velocity = float(velocity)
 
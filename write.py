@@ -28,8 +28,13 @@ def write_to_csv(results, filename):
         writer = csv.writer(file)
         writer.writerow(fieldnames)
 
-        for result in results:
-            writer.writerow([result.time, result.distance, result.velocity, result._designation, result.neo.name, result.neo.diameter, result.neo.hazardous])
+        def rows():
+            for result in results:
+                neo = result.neo
+                yield (datetime_to_str(result.time), result.distance, result.velocity,
+                       result._designation, neo.name or '', neo.diameter, neo.hazardous)
+
+        writer.writerows(rows())
 
 
 
@@ -44,24 +49,25 @@ def write_to_json(results, filename):
     :param results: An iterable of `CloseApproach` objects.
     :param filename: A Path-like object pointing to where the data should be saved.
     """
+    # Each record is encoded and written as it's produced, so the results are
+    # never all held in memory at once. Without `indent`, `json` uses its C
+    # encoder and the output is compact.
     with open(filename, 'w') as f:
-        data = []
+        f.write('[')
+        separator = ''
         for result in results:
-            if not result.neo.name:
-                result.neo.name = ''
-
             json_data = {
                  'datetime_utc': datetime_to_str(result.time),
                  'distance_au': result.distance,
                  'velocity_km_s': result.velocity,
                  'neo': {
                      'designation': result._designation,
-                     'name': result.neo.name,
+                     'name': result.neo.name or '',
                      'diameter_km': result.neo.diameter,
                      'potentially_hazardous': result.neo.hazardous
                  }
                  }
-            data.append(json_data)
-        json_object = json.dumps(data, indent=4)
-        f.write(json_object)
-
+            f.write(separator)
+            f.write(json.dumps(json_data))
+            separator = ', '
+        f.write(']')